@@ -0,0 +1,95 @@
+import queue
+import threading
+import time
+import typing
+from concurrent.futures import Future
+
+
+class MicroBatcher:
+    """Gathers concurrently submitted items into batches for a single call.
+
+    Items are grouped until `max_batch_size` is reached or `max_wait_ms` has
+    elapsed since the first item of the batch arrived. `func` receives the
+    list of items and must return one result per item, in the same order.
+    """
+
+    def __init__(
+        self,
+        func: typing.Callable[[typing.List[typing.Any]], typing.List[typing.Any]],
+        max_batch_size: int,
+        max_wait_ms: float = 2.0,
+        name: str = "modelib-batcher",
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be greater than zero")
+
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self._func = func
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._worker: typing.Optional[threading.Thread] = None
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def max_wait_ms(self) -> float:
+        return self._max_wait * 1000
+
+    def submit(self, item: typing.Any) -> Future:
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((item, future))
+        return future
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self) -> typing.List[typing.Tuple[typing.Any, Future]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            items = [item for item, _ in batch]
+
+            try:
+                results = self._func(items)
+                if len(results) != len(items):
+                    raise ValueError(
+                        f"Batch function returned {len(results)} results for {len(items)} items"
+                    )
+            except BaseException as ex:
+                for _, future in batch:
+                    future.set_exception(ex)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
@@ -0,0 +1,141 @@
+import collections
+import hashlib
+import json
+import sys
+import threading
+import time
+import typing
+from concurrent.futures import Future
+
+
+def payload_key(payload: dict) -> str:
+    """Canonical hash of a validated payload, independent of the key order."""
+    encoded = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def estimate_size(value: typing.Any) -> int:
+    """Approximate memory footprint, in bytes, of a JSON-like value."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(v) for v in value)
+
+    return size
+
+
+class PredictionCache:
+    """Thread-safe LRU cache of runner results with optional TTL and memory bound.
+
+    Concurrent requests for a key that is being computed wait for that single
+    computation instead of starting their own.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: typing.Optional[float] = None,
+        max_memory_bytes: typing.Optional[int] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than zero")
+
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._max_memory_bytes = max_memory_bytes
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._in_flight: typing.Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+
+    def _pop(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._memory_bytes -= size
+
+    def _lookup(self, key: str) -> typing.Tuple[bool, typing.Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._pop(key)
+            self._expirations += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: str, value: typing.Any) -> None:
+        size = estimate_size(value)
+        if self._max_memory_bytes is not None and size > self._max_memory_bytes:
+            return
+
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._entries[key] = (value, expires_at, size)
+        self._memory_bytes += size
+
+        while len(self._entries) > self._max_size or (
+            self._max_memory_bytes is not None
+            and self._memory_bytes > self._max_memory_bytes
+        ):
+            self._pop(next(iter(self._entries)))
+            self._evictions += 1
+
+    def get_or_compute(self, key: str, compute: typing.Callable[[], typing.Any]):
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                self._misses += 1
+                future = self._in_flight[key] = Future()
+            else:
+                self._coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as ex:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(ex)
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._in_flight[key]
+        future.set_result(value)
+
+        return value
@@ -1,8 +1,9 @@
 import typing
 
 import fastapi
+from fastapi.responses import StreamingResponse
 
-
+from modelib.core import schemas, streaming
 from modelib.runners.base import BaseRunner
 
 
@@ -22,10 +23,57 @@ def create_runner_endpoint(
 
     app.add_api_route(
         path,
-        runner.get_runner_func(),
+        runner.wrap_runner_func(runner.get_runner_func()),
         **route_kwargs,
     )
 
+    try:
+        batch_runner_func = runner.get_batch_runner_func()
+    except NotImplementedError:
+        batch_runner_func = None
+
+    if batch_runner_func is not None:
+        batch_route_kwargs = {
+            **route_kwargs,
+            "name": f"{runner.name} (batch)",
+            "response_model": schemas.BatchResultResponseModel,
+        }
+
+        app.add_api_route(
+            f"{path}/batch",
+            runner.wrap_runner_func(batch_runner_func),
+            **batch_route_kwargs,
+        )
+
+    try:
+        stream_runner_func = runner.get_stream_runner_func()
+    except NotImplementedError:
+        stream_runner_func = None
+
+    if stream_runner_func is not None:
+        stream_route_kwargs = {
+            **route_kwargs,
+            "name": f"{runner.name} (stream)",
+            "response_model": None,
+            "response_class": StreamingResponse,
+            "openapi_extra": {
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        streaming.NDJSON_MEDIA_TYPE: {
+                            "schema": runner.request_model.model_json_schema()
+                        }
+                    },
+                }
+            },
+        }
+
+        app.add_api_route(
+            f"{path}/stream",
+            stream_runner_func,
+            **stream_route_kwargs,
+        )
+
     return app
 
 
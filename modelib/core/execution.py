@@ -0,0 +1,83 @@
+import asyncio
+import contextvars
+import functools
+import typing
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from starlette.concurrency import run_in_threadpool
+
+ExecutorSetting = typing.Union[None, typing.Literal["thread", "inline"], Executor]
+
+
+def create_executor(
+    executor: ExecutorSetting,
+    max_workers: typing.Optional[int] = None,
+    name: str = "modelib",
+) -> typing.Optional[Executor]:
+    """Resolve the executor setting of a runner into the executor that will run it.
+
+    Args:
+        executor: None to use the shared FastAPI thread pool, "thread" for a dedicated
+            bounded thread pool, "inline" to run on the event loop or a custom
+            `concurrent.futures.Executor`.
+        max_workers: Maximum number of workers of the dedicated thread pool.
+        name: Prefix for the names of the dedicated thread pool threads.
+
+    Returns:
+        The executor where the runner will be executed, if any.
+    """
+    if executor is None or executor == "inline":
+        return None
+
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    if isinstance(executor, Executor):
+        return executor
+
+    raise ValueError(
+        "executor must be None, 'thread', 'inline' or a concurrent.futures.Executor"
+    )
+
+
+async def run_sync(
+    func: typing.Callable,
+    executor: ExecutorSetting,
+    resolved_executor: typing.Optional[Executor],
+    *args,
+    **kwargs,
+) -> typing.Any:
+    """Run a synchronous function from async code on the configured executor."""
+    if executor == "inline":
+        return func(*args, **kwargs)
+
+    if resolved_executor is None:
+        return await run_in_threadpool(func, *args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+
+    return await loop.run_in_executor(
+        resolved_executor,
+        functools.partial(context.run, func, *args, **kwargs),
+    )
+
+
+def wrap_runner_func(
+    func: typing.Callable,
+    executor: ExecutorSetting,
+    resolved_executor: typing.Optional[Executor] = None,
+) -> typing.Callable:
+    """Wrap a synchronous runner function so it is executed as configured.
+
+    The wrapper keeps the signature of `func`, so FastAPI still validates the
+    request against the runner's request model.
+    """
+    if executor is None:
+        return func
+
+    @functools.wraps(func)
+    async def executor_func(*args, **kwargs):
+        return await run_sync(func, executor, resolved_executor, *args, **kwargs)
+
+    return executor_func
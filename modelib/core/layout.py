@@ -0,0 +1,89 @@
+import threading
+import types
+import typing
+
+import numpy as np
+import pandas as pd
+import pydantic
+
+MAP_PYTHON_TYPE_TO_NUMPY_DTYPE = {
+    float: np.dtype("float64"),
+    int: np.dtype("int64"),
+    bool: np.dtype("bool"),
+}
+
+
+def numpy_dtype_from_annotation(annotation: typing.Any) -> typing.Optional[np.dtype]:
+    """Return the numpy dtype of a field annotation, or None if it must be kept as object."""
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1 or args[0] is not float:
+            return None
+        annotation = args[0]
+
+    return MAP_PYTHON_TYPE_TO_NUMPY_DTYPE.get(annotation)
+
+
+class InputLayout:
+    """Column order and dtypes of a request model, computed once per runner.
+
+    Payloads produced by `request_model.model_dump(by_alias=by_alias)` are laid
+    out following `columns`. When every column shares the same numpy dtype, the
+    rows are copied into a single homogeneous array instead of letting pandas
+    infer the dtype of each column.
+    """
+
+    def __init__(
+        self, request_model: typing.Type[pydantic.BaseModel], by_alias: bool = True
+    ):
+        self._request_model = request_model
+        self._columns = []
+        dtypes = []
+
+        for name, field in request_model.model_fields.items():
+            column = (field.serialization_alias or field.alias) if by_alias else None
+            self._columns.append(column or name)
+            dtypes.append(numpy_dtype_from_annotation(field.annotation))
+
+        self._dtype = (
+            dtypes[0] if dtypes and all(d == dtypes[0] for d in dtypes) else None
+        )
+        self._local = threading.local()
+
+    @property
+    def request_model(self) -> typing.Type[pydantic.BaseModel]:
+        return self._request_model
+
+    @property
+    def columns(self) -> typing.List[str]:
+        return self._columns
+
+    @property
+    def dtype(self) -> typing.Optional[np.dtype]:
+        return self._dtype
+
+    def rows(self, payloads: typing.List[dict]) -> typing.List[list]:
+        return [[payload[column] for column in self._columns] for payload in payloads]
+
+    def to_array(self, payloads: typing.List[dict]) -> np.ndarray:
+        return np.array(self.rows(payloads), dtype=self._dtype or object)
+
+    def fill(self, payload: dict) -> np.ndarray:
+        """Write a single payload into a preallocated, thread-local (1, n_columns) buffer."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = np.empty(
+                (1, len(self._columns)), dtype=self._dtype or object
+            )
+            self._local.buffer = buffer
+
+        buffer[0] = [payload[column] for column in self._columns]
+        return buffer
+
+    def to_frame(self, payloads: typing.List[dict]) -> pd.DataFrame:
+        if self._dtype is not None:
+            return pd.DataFrame(
+                self.to_array(payloads), columns=self._columns, copy=False
+            )
+
+        return pd.DataFrame.from_records(payloads, columns=self._columns)
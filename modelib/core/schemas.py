@@ -33,6 +33,10 @@ class ResultResponseWithStepsModel(ResultResponseModel):
     steps: typing.Dict[str, typing.Any]
 
 
+class BatchResultResponseModel(pydantic.BaseModel):
+    results: typing.List[typing.Dict[str, typing.Any]]
+
+
 class FeatureMetadataSchema(pydantic.BaseModel):
     name: str
     dtype: typing.Literal["object", "int64", "float64", "datetime64", "bool"]
@@ -87,3 +91,35 @@ def pydantic_field_from_dict(field_dict: dict) -> pydantic.Field:
         kwargs["alias"] = field_alias
 
     return (dtype, pydantic.Field(default, **kwargs))
+
+
+def validate_records(
+    adapter: pydantic.TypeAdapter, records: typing.List[typing.Any]
+) -> typing.Tuple[
+    typing.List[typing.Tuple[int, pydantic.BaseModel]],
+    typing.Dict[int, typing.List[dict]],
+]:
+    """Validate a list of records in bulk, collecting the errors of each invalid record.
+
+    Args:
+        adapter: TypeAdapter for a list of the request model.
+        records: Records to be validated.
+
+    Returns:
+        A tuple with the (index, model) pairs of the valid records and a dict
+        mapping the index of each invalid record to its validation errors.
+    """
+    try:
+        return list(enumerate(adapter.validate_python(records))), {}
+    except pydantic.ValidationError as ex:
+        errors = {}
+        for error in ex.errors(include_url=False, include_context=False):
+            index, *loc = error["loc"]
+            errors.setdefault(index, []).append(
+                {"loc": loc, "msg": error["msg"], "type": error["type"]}
+            )
+
+    valid_indexes = [i for i in range(len(records)) if i not in errors]
+    models = adapter.validate_python([records[i] for i in valid_indexes])
+
+    return list(zip(valid_indexes, models)), errors
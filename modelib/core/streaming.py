@@ -0,0 +1,62 @@
+import json
+import typing
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class InvalidLine:
+    """Placeholder for an NDJSON line that could not be decoded."""
+
+    def __init__(self, message: str):
+        self.message = message
+
+    def errors(self) -> typing.List[dict]:
+        return [{"loc": [], "msg": self.message, "type": "json_invalid"}]
+
+
+def decode_line(line: bytes) -> typing.Any:
+    try:
+        return json.loads(line)
+    except ValueError as ex:
+        return InvalidLine(f"Invalid JSON: {ex}")
+
+
+async def iter_ndjson_chunks(
+    stream: typing.AsyncIterator[bytes], chunk_size: int
+) -> typing.AsyncIterator[typing.List[typing.Any]]:
+    """Decode an NDJSON byte stream into chunks of at most `chunk_size` records.
+
+    Blank lines are skipped and lines that are not valid JSON are yielded as
+    `InvalidLine` instances, so each record keeps its position in the stream.
+    Only the current chunk and the pending partial line are kept in memory.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than zero")
+
+    pending = b""
+    chunk = []
+
+    async for data in stream:
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+
+        for line in lines:
+            if not line.strip():
+                continue
+
+            chunk.append(decode_line(line))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if pending.strip():
+        chunk.append(decode_line(pending))
+
+    if chunk:
+        yield chunk
+
+
+def encode_lines(items: typing.Iterable[typing.Any]) -> bytes:
+    return b"".join(
+        json.dumps(item, separators=(",", ":")).encode() + b"\n" for item in items
+    )
@@ -1,8 +1,9 @@
 import typing
+from concurrent.futures import Executor
 
 import pydantic
 from slugify import slugify
-from modelib.core import schemas
+from modelib.core import cache, execution, schemas
 
 
 def remove_unset_features(features: typing.List[dict]) -> typing.List[dict]:
@@ -19,12 +20,30 @@ class BaseRunner:
         request_model: typing.Union[typing.Type[pydantic.BaseModel], typing.List[dict]],
         response_model: typing.Type[pydantic.BaseModel] = schemas.ResultResponseModel,
         by_alias: bool = True,
+        executor: execution.ExecutorSetting = None,
+        max_workers: typing.Optional[int] = None,
+        cache_size: typing.Optional[int] = None,
+        cache_ttl_seconds: typing.Optional[float] = None,
+        cache_max_memory_bytes: typing.Optional[int] = None,
         **kwargs,
     ):
         self._name = name
         self.request_model = request_model
         self.response_model = response_model
         self._by_alias = by_alias
+        self._executor_setting = executor
+        self._executor = execution.create_executor(
+            executor, max_workers=max_workers, name=f"modelib-{self.slug}"
+        )
+        self._cache = (
+            cache.PredictionCache(
+                max_size=cache_size,
+                ttl_seconds=cache_ttl_seconds,
+                max_memory_bytes=cache_max_memory_bytes,
+            )
+            if cache_size
+            else None
+        )
 
     @property
     def name(self) -> str:
@@ -42,6 +61,26 @@ class BaseRunner:
     def by_alias(self) -> bool:
         return self._by_alias
 
+    @property
+    def executor_setting(self) -> execution.ExecutorSetting:
+        return self._executor_setting
+
+    @property
+    def executor(self) -> typing.Optional[Executor]:
+        return self._executor
+
+    @property
+    def cache(self) -> typing.Optional[cache.PredictionCache]:
+        return self._cache
+
+    def wrap_runner_func(self, func: typing.Callable) -> typing.Callable:
+        return execution.wrap_runner_func(func, self._executor_setting, self._executor)
+
+    async def run_sync(self, func: typing.Callable, *args, **kwargs) -> typing.Any:
+        return await execution.run_sync(
+            func, self._executor_setting, self._executor, *args, **kwargs
+        )
+
     @request_model.setter
     def request_model(
         self, value: typing.Union[typing.Type[pydantic.BaseModel], typing.List[dict]]
@@ -68,3 +107,9 @@ class BaseRunner:
 
     def get_runner_func(self) -> typing.Callable:
         raise NotImplementedError
+
+    def get_batch_runner_func(self) -> typing.Callable:
+        raise NotImplementedError
+
+    def get_stream_runner_func(self) -> typing.Callable:
+        raise NotImplementedError
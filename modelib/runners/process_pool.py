@@ -0,0 +1,116 @@
+import multiprocessing
+import pickle
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import fastapi
+import numpy as np
+import pandas as pd
+
+_WORKER_RUNNERS: typing.Dict[str, typing.Any] = {}
+
+
+def pack_input(
+    input_df: typing.Union[pd.DataFrame, np.ndarray],
+) -> typing.Tuple[str, typing.Any]:
+    """Pack an input frame as plain numpy arrays, which pickle without copying through python objects."""
+    if isinstance(input_df, pd.DataFrame):
+        return (
+            "frame",
+            (
+                list(input_df.columns),
+                [input_df[column].to_numpy() for column in input_df.columns],
+            ),
+        )
+
+    return ("array", input_df)
+
+
+def unpack_input(
+    packed_input: typing.Tuple[str, typing.Any],
+) -> typing.Union[pd.DataFrame, np.ndarray]:
+    kind, data = packed_input
+    if kind == "frame":
+        columns, arrays = data
+        return pd.DataFrame(dict(zip(columns, arrays)), columns=columns, copy=False)
+
+    return data
+
+
+def _init_worker(key: str, runner_bytes: typing.Optional[bytes]) -> None:
+    if runner_bytes is not None:
+        _WORKER_RUNNERS[key] = pickle.loads(runner_bytes)
+
+
+def _ping() -> bool:
+    return True
+
+
+def _execute_in_worker(
+    key: str, packed_input: typing.Tuple[str, typing.Any]
+) -> typing.Tuple[bool, typing.Any]:
+    try:
+        return True, _WORKER_RUNNERS[key].execute_batch(unpack_input(packed_input))
+    except fastapi.HTTPException as ex:
+        # HTTPException cannot be unpickled, so it is sent back as plain data.
+        return False, (ex.status_code, ex.detail)
+
+
+class RunnerProcessPool:
+    """Pool of worker processes holding a copy of a runner.
+
+    With the "fork" start method, the runner is registered before the workers are
+    forked, so they share its memory copy-on-write. With other start methods, the
+    runner is pickled once and shipped to each worker when it starts.
+    """
+
+    def __init__(
+        self,
+        runner: typing.Any,
+        max_workers: typing.Optional[int] = None,
+        start_method: typing.Optional[str] = None,
+    ):
+        if start_method is None:
+            start_method = (
+                "fork"
+                if "fork" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+
+        self._key = f"{runner.slug}-{id(runner)}"
+        self._start_method = start_method
+
+        if start_method == "fork":
+            _WORKER_RUNNERS[self._key] = runner
+            initargs = (self._key, None)
+        else:
+            initargs = (self._key, pickle.dumps(runner))
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+        self._executor.submit(_ping).result()
+
+    @property
+    def start_method(self) -> str:
+        return self._start_method
+
+    def execute_batch(
+        self, input_df: typing.Union[pd.DataFrame, np.ndarray]
+    ) -> typing.List[dict]:
+        ok, data = self._executor.submit(
+            _execute_in_worker, self._key, pack_input(input_df)
+        ).result()
+
+        if not ok:
+            status_code, detail = data
+            raise fastapi.HTTPException(status_code=status_code, detail=detail)
+
+        return data
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+        _WORKER_RUNNERS.pop(self._key, None)
@@ -4,23 +4,72 @@ import numpy as np
 import pandas as pd
 import pydantic
 
-from modelib.core import exceptions, schemas
+from modelib.core import batching, cache, exceptions, layout, schemas, streaming
 
+from . import process_pool
 from .base import BaseRunner
 from sklearn.base import BaseEstimator
 import fastapi
+from fastapi.responses import StreamingResponse
 from abc import abstractmethod
 import logging
 
 
+def split_step_output(
+    step_name: str, step_output: typing.Any, n_rows: int
+) -> typing.List[typing.Any]:
+    """Split the output of a pipeline step into one single-row output per input row."""
+    if isinstance(step_output, pd.DataFrame):
+        return [[record] for record in step_output.to_dict(orient="records")]
+    elif isinstance(step_output, pd.Series):
+        return [{index: value} for index, value in step_output.to_dict().items()]
+    elif isinstance(step_output, np.ndarray):
+        return [[value] for value in step_output.tolist()]
+    elif isinstance(step_output, list):
+        return [[value] for value in step_output]
+    elif isinstance(step_output, dict):
+        return [step_output] * n_rows
+
+    raise ValueError(
+        f"Predictor step {step_name} returned an unsupported type: {type(step_output)}"
+    )
+
+
 class SklearnBaseRunner(BaseRunner):
+    # Attributes holding threads, pools or dynamically created classes, which are
+    # not shipped to process pool workers.
+    _runtime_attributes = (
+        "_request_model",
+        "_input_layout",
+        "_records_adapter",
+        "_records_adapter_model",
+        "_batcher",
+        "_executor",
+        "_cache",
+        "_process_pool",
+    )
+
     def __init__(
         self,
         predictor: BaseEstimator,
         method_names: typing.Union[str, typing.List[str]],
         logger: logging.Logger = logging.getLogger("uvicorn.error"),
+        max_batch_size: typing.Optional[int] = None,
+        max_batch_wait_ms: float = 2.0,
+        input_format: typing.Literal["auto", "pandas", "numpy"] = "auto",
+        n_processes: typing.Optional[int] = None,
+        process_start_method: typing.Optional[str] = None,
+        stream_chunk_size: int = 1024,
         **kwargs,
     ):
+        if input_format not in ("auto", "pandas", "numpy"):
+            raise ValueError("input_format must be one of 'auto', 'pandas' or 'numpy'")
+
+        self._input_format = input_format
+        self._input_layout = None
+        self._records_adapter = None
+        self._records_adapter_model = None
+        self._stream_chunk_size = stream_chunk_size
         self._method_names = (
             [method_names] if isinstance(method_names, str) else method_names
         )
@@ -30,6 +79,35 @@ class SklearnBaseRunner(BaseRunner):
 
         super().__init__(**kwargs)
 
+        self._batcher = (
+            batching.MicroBatcher(
+                self._execute_payloads,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_batch_wait_ms,
+                name=f"modelib-batcher-{self.slug}",
+            )
+            if max_batch_size is not None and max_batch_size > 1
+            else None
+        )
+
+        if self._batcher is not None and self.executor_setting == "inline":
+            raise ValueError("Batching is not supported with the 'inline' executor")
+
+        self._process_pool = (
+            process_pool.RunnerProcessPool(
+                self, max_workers=n_processes, start_method=process_start_method
+            )
+            if n_processes
+            else None
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        for key in self._runtime_attributes:
+            state[key] = None
+
+        return state
+
     @property
     def method_names(self) -> typing.List[str]:
         return self._method_names
@@ -42,22 +120,99 @@ class SklearnBaseRunner(BaseRunner):
     def validate(self) -> None:
         pass
 
+    @property
+    def batcher(self) -> typing.Optional[batching.MicroBatcher]:
+        return self._batcher
+
+    @property
+    def process_pool(self) -> typing.Optional[process_pool.RunnerProcessPool]:
+        return self._process_pool
+
+    @property
+    def records_adapter(self) -> pydantic.TypeAdapter:
+        if (
+            self._records_adapter is None
+            or self._records_adapter_model is not self.request_model
+        ):
+            self._records_adapter = pydantic.TypeAdapter(
+                typing.List[self.request_model]
+            )
+            self._records_adapter_model = self.request_model
+
+        return self._records_adapter
+
+    @property
+    def input_format(self) -> str:
+        return self._input_format
+
+    @property
+    def input_layout(self) -> layout.InputLayout:
+        if (
+            self._input_layout is None
+            or self._input_layout.request_model is not self.request_model
+        ):
+            self._input_layout = layout.InputLayout(
+                self.request_model, by_alias=self.by_alias
+            )
+
+        return self._input_layout
+
+    def accepts_array(self) -> bool:
+        """Whether the predictor can be fed a numpy array instead of a DataFrame."""
+        if self._input_format == "auto":
+            return not hasattr(self.predictor, "feature_names_in_")
+
+        return self._input_format == "numpy"
+
+    def build_input(
+        self, payloads: typing.List[dict]
+    ) -> typing.Union[pd.DataFrame, np.ndarray]:
+        if not self.accepts_array():
+            return self.input_layout.to_frame(payloads)
+
+        if len(payloads) == 1:
+            return self.input_layout.fill(payloads[0])
+
+        return self.input_layout.to_array(payloads)
+
     @abstractmethod
-    def execute(self, input_df: pd.DataFrame) -> dict:
+    def execute_batch(self, input_df: pd.DataFrame) -> typing.List[dict]:
         pass
 
+    def execute(self, input_df: pd.DataFrame) -> dict:
+        return self.execute_batch(input_df)[0]
+
+    def dispatch_batch(
+        self, input_df: typing.Union[pd.DataFrame, np.ndarray]
+    ) -> typing.List[dict]:
+        """Execute a batch in the process pool, if any, or in the calling thread."""
+        if self._process_pool is not None:
+            return self._process_pool.execute_batch(input_df)
+
+        return self.execute_batch(input_df)
+
+    def predict_payload(self, payload: dict) -> dict:
+        if self._batcher is not None:
+            return self._batcher.submit(payload).result()
+
+        return self.dispatch_batch(self.build_input([payload]))[0]
+
+    def _execute_payloads(self, payloads: typing.List[dict]) -> typing.List[dict]:
+        return self.dispatch_batch(self.build_input(payloads))
+
     def get_runner_func(self) -> typing.Callable:
         def runner_func(data: self.request_model):
             payload = None
             try:
                 payload = data.model_dump(by_alias=self.by_alias)
 
-                input_df = (
-                    pd.DataFrame(payload, index=[0])
-                    if isinstance(data, pydantic.BaseModel)
-                    else data
-                )
-                result = self.execute(input_df)
+                if self.cache is not None:
+                    result = self.cache.get_or_compute(
+                        cache.payload_key(payload),
+                        lambda: self.predict_payload(payload),
+                    )
+                else:
+                    result = self.predict_payload(payload)
 
                 self._logger.info(
                     {
@@ -92,6 +247,110 @@ class SklearnBaseRunner(BaseRunner):
         runner_func.__name__ = self.name
         return runner_func
 
+    def score_records(self, records: typing.List[typing.Any]) -> typing.List[dict]:
+        """Validate and score a list of raw records with a single predictor call.
+
+        Invalid records do not prevent the others from being scored; their
+        position in the returned list holds their validation errors instead.
+        """
+        valid_records, errors = schemas.validate_records(self.records_adapter, records)
+
+        results = [{"errors": errors.get(i)} for i in range(len(records))]
+        if valid_records:
+            input_df = self.build_input(
+                [
+                    record.model_dump(by_alias=self.by_alias)
+                    for _, record in valid_records
+                ]
+            )
+            for (i, _), result in zip(valid_records, self.dispatch_batch(input_df)):
+                results[i] = result
+
+        return results
+
+    def get_batch_runner_func(self) -> typing.Callable:
+        def batch_runner_func(data: typing.List[typing.Dict[str, typing.Any]]):
+            try:
+                results = self.score_records(data)
+
+                self._logger.info(
+                    {
+                        "msg": "Successfully executed batch runner",
+                        "runner": self.name,
+                        "n_records": len(data),
+                        "n_errors": sum("errors" in result for result in results),
+                    },
+                )
+
+                return {"results": results}
+            except Exception as ex:
+                self._logger.error(
+                    {
+                        "msg": "Error during batch runner execution",
+                        "runner": self.name,
+                    },
+                    exc_info=True,
+                )
+                if isinstance(ex, fastapi.HTTPException):
+                    raise ex
+
+                raise fastapi.HTTPException(
+                    status_code=500,
+                    detail={
+                        "runner": self.name,
+                        **exceptions.parse_exception(ex),
+                    },
+                )
+
+        batch_runner_func.__name__ = f"{self.name} batch"
+        return batch_runner_func
+
+    async def _score_chunk(self, chunk: typing.List[typing.Any]) -> typing.List[dict]:
+        results = [
+            {"errors": record.errors()}
+            if isinstance(record, streaming.InvalidLine)
+            else None
+            for record in chunk
+        ]
+        positions = [i for i, result in enumerate(results) if result is None]
+
+        try:
+            scored = await self.run_sync(
+                self.score_records, [chunk[i] for i in positions]
+            )
+        except Exception as ex:
+            self._logger.error(
+                {
+                    "msg": "Error during stream runner execution",
+                    "runner": self.name,
+                },
+                exc_info=True,
+            )
+            error = (
+                ex.detail
+                if isinstance(ex, fastapi.HTTPException)
+                else {"runner": self.name, **exceptions.parse_exception(ex)}
+            )
+            scored = [{"error": error}] * len(positions)
+
+        for i, result in zip(positions, scored):
+            results[i] = result
+
+        return results
+
+    def get_stream_runner_func(self) -> typing.Callable:
+        async def stream_runner_func(request: fastapi.Request):
+            async def results() -> typing.AsyncIterator[bytes]:
+                async for chunk in streaming.iter_ndjson_chunks(
+                    request.stream(), self._stream_chunk_size
+                ):
+                    yield streaming.encode_lines(await self._score_chunk(chunk))
+
+            return StreamingResponse(results(), media_type=streaming.NDJSON_MEDIA_TYPE)
+
+        stream_runner_func.__name__ = f"{self.name} stream"
+        return stream_runner_func
+
 
 class SklearnRunner(SklearnBaseRunner):
     def validate(self) -> None:
@@ -101,10 +360,10 @@ class SklearnRunner(SklearnBaseRunner):
         if not hasattr(self.predictor, self.method_names[0]):
             raise ValueError(f"Predictor does not have method {self.method_names[0]}")
 
-    def execute(self, input_df) -> dict:
+    def execute_batch(self, input_df: pd.DataFrame) -> typing.List[dict]:
         predictor_method = getattr(self.predictor, self.method_names[0])
 
-        return {"result": predictor_method(input_df).tolist()[0]}
+        return [{"result": value} for value in predictor_method(input_df).tolist()]
 
 
 class SklearnPipelineRunner(SklearnBaseRunner):
@@ -123,8 +382,8 @@ class SklearnPipelineRunner(SklearnBaseRunner):
                     f"Predictor does not have method {method_name} in step {self.predictor.steps[i][0]}"
                 )
 
-    def execute(self, input_df: pd.DataFrame) -> dict:
-        step_outputs = {}
+    def execute_batch(self, input_df: pd.DataFrame) -> typing.List[dict]:
+        rows_steps = [{} for _ in range(len(input_df))]
         previous_step_output = input_df.copy()
         for i, method_name in enumerate(self.method_names):
             try:
@@ -143,25 +402,21 @@ class SklearnPipelineRunner(SklearnBaseRunner):
                     },
                 )
 
-            if isinstance(previous_step_output, pd.DataFrame):
-                step_outputs[step_name] = previous_step_output.to_dict(orient="records")
-            elif isinstance(previous_step_output, pd.Series):
-                step_outputs[step_name] = previous_step_output.to_dict()
-            elif isinstance(previous_step_output, np.ndarray):
-                step_outputs[step_name] = previous_step_output.tolist()
-            elif isinstance(previous_step_output, list) or isinstance(
-                previous_step_output, dict
-            ):
-                step_outputs[step_name] = previous_step_output
-            else:
-                raise ValueError(
-                    f"Predictor step {step_name} returned an unsupported type: {type(previous_step_output)}"
-                )
+            step_rows = split_step_output(
+                step_name, previous_step_output, len(rows_steps)
+            )
+            for row_steps, step_row in zip(rows_steps, step_rows):
+                row_steps[step_name] = step_row
+
+        if isinstance(previous_step_output, pd.Series):
+            results = previous_step_output.tolist()
+        else:
+            results = [row_steps[step_name][0] for row_steps in rows_steps]
 
-        return {
-            "result": step_outputs[step_name][0],
-            "steps": step_outputs,
-        }
+        return [
+            {"result": result, "steps": row_steps}
+            for result, row_steps in zip(results, rows_steps)
+        ]
 
     @property
     def response_model(self) -> typing.Type[pydantic.BaseModel]:
@@ -0,0 +1,102 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modelib.core import cache
+
+
+def test_payload_key_is_canonical():
+    assert cache.payload_key({"a": 1, "b": 2.0}) == cache.payload_key(
+        {"b": 2.0, "a": 1}
+    )
+    assert cache.payload_key({"a": 1}) != cache.payload_key({"a": 2})
+
+
+def test_lru_eviction():
+    prediction_cache = cache.PredictionCache(max_size=2)
+
+    for key in ["a", "b", "a", "c"]:
+        prediction_cache.get_or_compute(key, lambda key=key: {"result": key})
+
+    stats = prediction_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+    calls = []
+    prediction_cache.get_or_compute("b", lambda: calls.append("b"))
+    assert calls == ["b"]
+
+
+def test_ttl_expiration():
+    prediction_cache = cache.PredictionCache(ttl_seconds=0.01)
+
+    prediction_cache.get_or_compute("a", lambda: 1)
+    time.sleep(0.02)
+    prediction_cache.get_or_compute("a", lambda: 1)
+
+    stats = prediction_cache.stats()
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+
+
+def test_memory_bound():
+    value = {"result": list(range(10))}
+    size = cache.estimate_size(value)
+    prediction_cache = cache.PredictionCache(max_memory_bytes=size * 2)
+
+    for key in ["a", "b", "c"]:
+        prediction_cache.get_or_compute(key, lambda: value)
+
+    stats = prediction_cache.stats()
+    assert stats["size"] == 2
+    assert stats["memory_bytes"] <= size * 2
+    assert stats["evictions"] == 1
+
+    prediction_cache.get_or_compute("big", lambda: {"result": list(range(1000))})
+    assert prediction_cache.stats()["size"] == 2
+
+
+def test_single_flight():
+    prediction_cache = cache.PredictionCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"result": 1}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        owner = executor.submit(prediction_cache.get_or_compute, "a", compute)
+        started.wait()
+        waiters = [
+            executor.submit(prediction_cache.get_or_compute, "a", compute)
+            for _ in range(3)
+        ]
+        while prediction_cache.stats()["coalesced"] < 3:
+            time.sleep(0.001)
+        release.set()
+
+        results = [owner.result()] + [w.result() for w in waiters]
+
+    assert results == [{"result": 1}] * 4
+    assert len(calls) == 1
+
+
+def test_errors_are_not_cached():
+    prediction_cache = cache.PredictionCache()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        prediction_cache.get_or_compute("a", fail)
+
+    assert prediction_cache.get_or_compute("a", lambda: 1) == 1
+    assert prediction_cache.stats()["size"] == 1
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modelib.core import execution
+
+
+def runner_func(data: int):
+    return {"result": data, "thread": threading.current_thread().name}
+
+
+def test_create_executor():
+    assert execution.create_executor(None) is None
+    assert execution.create_executor("inline") is None
+
+    executor = execution.create_executor("thread", max_workers=2, name="test")
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert executor._max_workers == 2
+    executor.shutdown()
+
+    custom_executor = ThreadPoolExecutor(max_workers=1)
+    assert execution.create_executor(custom_executor) is custom_executor
+    custom_executor.shutdown()
+
+    with pytest.raises(ValueError):
+        execution.create_executor("process-ish")
+
+
+def test_wrap_runner_func():
+    assert execution.wrap_runner_func(runner_func, None) is runner_func
+
+    inline_func = execution.wrap_runner_func(runner_func, "inline")
+    assert asyncio.iscoroutinefunction(inline_func)
+    assert asyncio.run(inline_func(1)) == {
+        "result": 1,
+        "thread": threading.current_thread().name,
+    }
+
+    executor = execution.create_executor("thread", max_workers=1, name="dedicated")
+    executor_func = execution.wrap_runner_func(runner_func, "thread", executor)
+    result = asyncio.run(executor_func(data=2))
+    executor.shutdown()
+
+    assert result["result"] == 2
+    assert result["thread"].startswith("dedicated")
@@ -0,0 +1,79 @@
+import typing
+
+import numpy as np
+import pandas as pd
+import pydantic
+
+import example
+from modelib.core import layout, schemas
+
+
+def test_numpy_dtype_from_annotation():
+    assert layout.numpy_dtype_from_annotation(float) == np.dtype("float64")
+    assert layout.numpy_dtype_from_annotation(int) == np.dtype("int64")
+    assert layout.numpy_dtype_from_annotation(typing.Optional[float]) == np.dtype(
+        "float64"
+    )
+    assert layout.numpy_dtype_from_annotation(typing.Optional[int]) is None
+    assert layout.numpy_dtype_from_annotation(str) is None
+
+
+def test_homogeneous_layout():
+    input_layout = layout.InputLayout(example.InputData, by_alias=True)
+
+    assert input_layout.columns == [
+        "sepal length (cm)",
+        "sepal width (cm)",
+        "petal length (cm)",
+        "petal width (cm)",
+    ]
+    assert input_layout.dtype == np.dtype("float64")
+
+    payload = example.InputData(
+        **{column: i for i, column in enumerate(input_layout.columns)}
+    ).model_dump(by_alias=True)
+
+    frame = input_layout.to_frame([payload, payload])
+    pd.testing.assert_frame_equal(frame, pd.DataFrame([payload, payload]))
+
+    buffer = input_layout.fill(payload)
+    assert buffer.shape == (1, 4)
+    assert buffer.tolist() == [[0.0, 1.0, 2.0, 3.0]]
+    assert input_layout.fill(payload) is buffer
+
+    assert layout.InputLayout(example.InputData, by_alias=False).columns == [
+        "sepal_length",
+        "sepal_width",
+        "petal_length",
+        "petal_width",
+    ]
+
+
+def test_heterogeneous_layout():
+    model = schemas.pydantic_model_from_list_of_dicts(
+        "test",
+        [
+            {"name": "name", "dtype": "object"},
+            {"name": "age", "dtype": "int64"},
+            {"name": "score", "dtype": "float64", "default": 1.0},
+        ],
+    )
+    input_layout = layout.InputLayout(model)
+
+    assert input_layout.dtype is None
+
+    payload = model(name="a", age=1).model_dump()
+    frame = input_layout.to_frame([payload])
+
+    pd.testing.assert_frame_equal(frame, pd.DataFrame(payload, index=[0]))
+    assert input_layout.to_array([payload]).dtype == np.dtype(object)
+
+
+def test_layout_follows_field_order_not_payload_order():
+    class Model(pydantic.BaseModel):
+        b: float
+        a: float
+
+    input_layout = layout.InputLayout(Model)
+
+    assert input_layout.to_array([{"a": 1.0, "b": 2.0}]).tolist() == [[2.0, 1.0]]
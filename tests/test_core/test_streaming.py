@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from modelib.core import streaming
+
+
+async def collect_chunks(parts, chunk_size):
+    async def stream():
+        for part in parts:
+            yield part
+
+    return [chunk async for chunk in streaming.iter_ndjson_chunks(stream(), chunk_size)]
+
+
+def test_iter_ndjson_chunks():
+    parts = [b'{"a": 1}\n{"a"', b': 2}\n\n{"a": 3}\nnot json\n{"a": 4}']
+
+    chunks = asyncio.run(collect_chunks(parts, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0] == [{"a": 1}, {"a": 2}]
+    assert chunks[1][0] == {"a": 3}
+    assert isinstance(chunks[1][1], streaming.InvalidLine)
+    assert chunks[1][1].errors()[0]["type"] == "json_invalid"
+    assert chunks[2] == [{"a": 4}]
+
+
+def test_iter_ndjson_chunks_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        asyncio.run(collect_chunks([b"{}"], chunk_size=0))
+
+
+def test_encode_lines():
+    assert streaming.encode_lines([{"result": 1}, {"result": 2}]) == (
+        b'{"result":1}\n{"result":2}\n'
+    )
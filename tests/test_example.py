@@ -1,3 +1,5 @@
+import json
+
 import fastapi
 from fastapi.testclient import TestClient
 import example
@@ -143,3 +145,114 @@ def test_runners(runner, endpoint_path, expected_response):
 
     assert response.status_code == 200
     assert response.json() == expected_response
+
+
+def test_batch_endpoints():
+    client = TestClient(example.app)
+
+    valid = {
+        "sepal length (cm)": 0,
+        "sepal width (cm)": 0,
+        "petal length (cm)": 0,
+        "petal width (cm)": 0,
+    }
+    virginica = {
+        "sepal length (cm)": 6.7,
+        "sepal width (cm)": 3.0,
+        "petal length (cm)": 5.2,
+        "petal width (cm)": 2.3,
+    }
+    invalid = {**valid, "petal width (cm)": "wide"}
+
+    response = client.post("/my-simple-model/batch", json=[valid, invalid, virginica])
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"result": 0}
+    assert results[1]["errors"][0]["loc"] == ["petal width (cm)"]
+    assert results[2] == {"result": 2}
+
+    response = client.post("/pipeline-model/batch", json=[valid, virginica])
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["result"] for r in results] == [0, 2]
+    assert results[1]["steps"]["clf"] == [2]
+
+    response = client.post("/pipeline-model/batch", json=[invalid])
+
+    assert response.status_code == 200
+    assert response.json()["results"][0]["errors"][0]["type"] == "float_parsing"
+
+
+@pytest.mark.parametrize("executor", ["thread", "inline"])
+def test_runner_executors(executor):
+    runner = ml.SklearnRunner(
+        name="my simple model",
+        predictor=example.MODEL,
+        method_names="predict",
+        request_model=example.InputData,
+        executor=executor,
+        max_workers=2,
+    )
+
+    client = TestClient(ml.init_app(app=fastapi.FastAPI(), runners=[runner]))
+
+    payload = {
+        "sepal length (cm)": 0,
+        "sepal width (cm)": 0,
+        "petal length (cm)": 0,
+        "petal width (cm)": 0,
+    }
+
+    response = client.post("/my-simple-model", json=payload)
+    assert response.status_code == 200
+    assert response.json() == {"result": 0}
+
+    response = client.post("/my-simple-model/batch", json=[payload])
+    assert response.status_code == 200
+    assert response.json() == {"results": [{"result": 0}]}
+
+    response = client.post("/my-simple-model", json={})
+    assert response.status_code == 422
+
+
+def test_stream_endpoints():
+    client = TestClient(example.app)
+
+    valid = {
+        "sepal length (cm)": 0,
+        "sepal width (cm)": 0,
+        "petal length (cm)": 0,
+        "petal width (cm)": 0,
+    }
+    virginica = {
+        "sepal length (cm)": 6.7,
+        "sepal width (cm)": 3.0,
+        "petal length (cm)": 5.2,
+        "petal width (cm)": 2.3,
+    }
+    body = "\n".join(
+        [json.dumps(valid), "{broken", json.dumps(virginica), json.dumps({})]
+    )
+
+    response = client.post(
+        "/my-simple-model/stream",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 4
+    assert lines[0] == {"result": 0}
+    assert lines[1]["errors"][0]["type"] == "json_invalid"
+    assert lines[2] == {"result": 2}
+    assert lines[3]["errors"][0]["type"] == "missing"
+
+    response = client.post("/pipeline-model/stream", content=json.dumps(virginica))
+
+    assert response.status_code == 200
+    assert json.loads(response.text)["steps"]["clf"] == [2]
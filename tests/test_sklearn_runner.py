@@ -1,5 +1,8 @@
-from modelib.runners.sklearn import SklearnRunner
+from concurrent.futures import ThreadPoolExecutor
+
+from modelib.runners.sklearn import SklearnRunner, SklearnPipelineRunner
 import example
+import numpy as np
 import pandas as pd
 import pytest
 import fastapi
@@ -15,6 +18,16 @@ def input_example() -> dict:
     }
 
 
+@pytest.fixture
+def virginica_example() -> dict:
+    return {
+        "sepal length (cm)": 6.7,
+        "sepal width (cm)": 3.0,
+        "petal length (cm)": 5.2,
+        "petal width (cm)": 2.3,
+    }
+
+
 @pytest.fixture
 def input_example_df(input_example) -> pd.DataFrame:
     return pd.DataFrame(
@@ -65,3 +78,169 @@ def test_sklearn_runner_with_error():
     )
     assert ex.value.detail["type"] == "AttributeError"
     assert ex.value.detail["traceback"] is not None
+
+
+def test_sklearn_runner_with_batching(input_example, virginica_example):
+    model = example.create_model()
+    batch_sizes = []
+    predict = model.predict
+
+    def counting_predict(input_df):
+        batch_sizes.append(len(input_df))
+        return predict(input_df)
+
+    model.predict = counting_predict
+
+    runner = SklearnRunner(
+        name="my batched model",
+        predictor=model,
+        method_names="predict",
+        request_model=example.features_metadata,
+        max_batch_size=8,
+        max_batch_wait_ms=50,
+    )
+    assert runner.batcher is not None
+    assert runner.batcher.max_batch_size == 8
+
+    runner_func = runner.get_runner_func()
+    inputs = [
+        runner.request_model(**input_example),
+        runner.request_model(**virginica_example),
+    ] * 4
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        results = list(executor.map(runner_func, inputs))
+
+    assert results == [{"result": 0}, {"result": 2}] * 4
+    assert sum(batch_sizes) == len(inputs)
+    assert len(batch_sizes) < len(inputs)
+
+
+def test_pipeline_runner_execute_batch(input_example, virginica_example):
+    runner = SklearnPipelineRunner(
+        name="Pipeline Model",
+        predictor=example.create_model(),
+        method_names=["transform", "predict"],
+        request_model=example.features_metadata,
+    )
+
+    input_df = pd.DataFrame([input_example, virginica_example])
+    results = runner.execute_batch(input_df)
+
+    assert [r["result"] for r in results] == [0, 2]
+    assert results[0] == runner.execute(input_df.iloc[[0]])
+    assert results[1]["steps"]["clf"] == [2]
+    assert len(results[1]["steps"]["scaler"]) == 1
+
+
+def test_sklearn_runner_numpy_input(input_example):
+    from sklearn.datasets import load_iris
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = load_iris(return_X_y=True)
+    model = RandomForestClassifier(n_estimators=5, random_state=42).fit(X, y)
+
+    runner = SklearnRunner(
+        name="my numpy model",
+        predictor=model,
+        method_names="predict",
+        request_model=example.InputData,
+    )
+
+    assert runner.accepts_array()
+    assert isinstance(runner.build_input([input_example]), np.ndarray)
+
+    runner_func = runner.get_runner_func()
+    expected = model.predict(np.zeros((1, 4))).tolist()[0]
+
+    assert runner_func(runner.request_model(**input_example)) == {"result": expected}
+
+    pandas_runner = SklearnRunner(
+        name="my pandas model",
+        predictor=model,
+        method_names="predict",
+        request_model=example.InputData,
+        input_format="pandas",
+    )
+
+    assert not pandas_runner.accepts_array()
+    assert isinstance(pandas_runner.build_input([input_example]), pd.DataFrame)
+
+    with pytest.raises(ValueError):
+        SklearnRunner(
+            name="my invalid model",
+            predictor=model,
+            method_names="predict",
+            request_model=example.InputData,
+            input_format="arrow",
+        )
+
+
+def test_sklearn_runner_inline_executor_with_batching():
+    with pytest.raises(ValueError):
+        SklearnRunner(
+            name="my simple model",
+            predictor=example.MODEL,
+            method_names="predict",
+            request_model=example.InputData,
+            executor="inline",
+            max_batch_size=8,
+        )
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_sklearn_runner_with_process_pool(
+    input_example, virginica_example, start_method
+):
+    runner = SklearnPipelineRunner(
+        name="Pipeline Model",
+        predictor=example.create_model(),
+        method_names=["transform", "predict"],
+        request_model=example.features_metadata,
+        n_processes=2,
+        process_start_method=start_method,
+    )
+
+    try:
+        assert runner.process_pool.start_method == start_method
+
+        input_df = pd.DataFrame([input_example, virginica_example])
+        assert runner.dispatch_batch(input_df) == runner.execute_batch(input_df)
+
+        runner_func = runner.get_runner_func()
+        assert runner_func(runner.request_model(**input_example))["result"] == 0
+
+        with pytest.raises(fastapi.HTTPException) as ex:
+            runner.dispatch_batch(input_df.drop(columns=["petal width (cm)"]))
+
+        assert ex.value.detail["step"] == "scaler"
+    finally:
+        runner.process_pool.shutdown()
+
+
+def test_sklearn_runner_with_cache(input_example, virginica_example):
+    model = example.create_model()
+    calls = []
+    predict = model.predict
+
+    def counting_predict(input_df):
+        calls.append(len(input_df))
+        return predict(input_df)
+
+    model.predict = counting_predict
+
+    runner = SklearnRunner(
+        name="my cached model",
+        predictor=model,
+        method_names="predict",
+        request_model=example.features_metadata,
+        cache_size=16,
+    )
+    runner_func = runner.get_runner_func()
+
+    for data in [input_example, input_example, virginica_example, input_example]:
+        runner_func(runner.request_model(**data))
+
+    assert len(calls) == 2
+    assert runner.cache.stats()["hits"] == 2
+    assert runner.cache.stats()["misses"] == 2